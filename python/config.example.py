@@ -206,13 +206,16 @@ WATCHDOG_TIMEOUT = 8000  # milliseconds (8 seconds)
 # ============================================================================
 
 # 1602 LCD display with I2C backpack (PCF8574)
-# If these settings are not defined, LCD display will be disabled
+# Set LCD_ENABLED to turn the display on or off. If it is not defined, the
+# display is enabled only when the I2C pins below are defined.
 #
 # Display-only mode: Shows temperature, state, target temp, and SSR output
 # Updates every 2 seconds. No buttons needed.
 #
 # To enable the LCD display, uncomment and configure the following:
 
+# LCD_ENABLED = True       # Master switch for the LCD display
+
 # I2C Configuration for LCD
 # LCD_I2C_ID = 0           # I2C bus ID (0 or 1)
 # LCD_I2C_SCL = 21         # I2C SCL pin
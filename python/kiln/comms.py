@@ -628,3 +628,31 @@ class StatusCache:
         """
         with self.lock:
             return {field: self._status.get(field) for field in fields}
+
+    def get_values(self, fields, defaults, out=None):
+        """
+        Get multiple fields from cached status as a list, in order
+
+        Unlike get_fields(), no dict is built. A caller reading the same
+        fields in a loop can pass its own list as out, so the lock is held
+        only for the lookups and nothing is allocated per call.
+
+        Args:
+            fields: Tuple of field names to retrieve
+            defaults: Tuple of defaults, one per field (used if missing)
+            out: Optional list of len(fields) to fill in place
+
+        Returns:
+            List of field values (out, if given)
+
+        Example:
+            state, temp = cache.get_values(('state', 'current_temp'), ('IDLE', 0.0))
+        """
+        n = len(fields)
+        if out is None:
+            out = [None] * n
+        with self.lock:
+            status = self._status
+            for i in range(n):
+                out[i] = status.get(fields[i], defaults[i])
+        return out
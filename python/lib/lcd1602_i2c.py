@@ -45,6 +45,9 @@ class LCD1602:
     LCD_5x10DOTS = 0x04
     LCD_5x8DOTS = 0x00
     
+    # DDRAM address of the first column of each row
+    ROW_OFFSETS = (0x00, 0x40, 0x14, 0x54)
+
     # Flags for backlight control
     LCD_BACKLIGHT = 0x08
     LCD_NOBACKLIGHT = 0x00
@@ -92,6 +95,17 @@ class LCD1602:
         else:
             self.backlight = self.backlight_bit  # Active high
 
+        # Set by the first failed I2C write; the remaining writes of the
+        # current operation are skipped instead of each timing out again
+        self.io_error = False
+
+        # Reused burst buffers: 6 port-state bytes per LCD byte, one cursor
+        # move + cols characters per row (no buffer allocation per print).
+        # The frame buffer holds one span for every row of the display.
+        self._row_buf = bytearray(6 * (cols + 1))
+        self._frame_buf = bytearray(6 * (cols + 1) * rows)
+        self._frame_mv = memoryview(self._frame_buf)
+
     async def initialize(self):
         """
         Initialize LCD hardware (async, non-blocking)
@@ -102,6 +116,8 @@ class LCD1602:
         Raises:
             OSError: If I2C communication fails
         """
+        self.io_error = False
+
         # Initialize display - wait for power-on
         await asyncio.sleep(0.05)  # Wait >40ms after power on
 
@@ -128,12 +144,15 @@ class LCD1602:
         await asyncio.sleep(0.001)
         self._send_command(self.LCD_DISPLAYCONTROL | self.LCD_DISPLAYON | self.LCD_CURSOROFF | self.LCD_BLINKOFF)
         await asyncio.sleep(0.001)
-        self.clear()
+        self._clear()
         await asyncio.sleep(0.01)  # Wait after clear before continuing (matches debug script)
         self._send_command(self.LCD_ENTRYMODESET | self.LCD_ENTRYLEFT | self.LCD_ENTRYSHIFTDECREMENT)
         await asyncio.sleep(0.002)
+
+        if self.io_error:
+            raise OSError("LCD I2C write failed during initialization")
     
-    def _write4bits(self, data):
+    def _write4bits(self, data, settle=True):
         """
         Write 4 bits to I2C with proper enable pulse
 
@@ -141,7 +160,20 @@ class LCD1602:
         1. Data setup (with E=0)
         2. E high pulse (min 450ns)
         3. E low (min 500ns total cycle)
+
+        Skipped once io_error is set (the bus is known to be failing).
+        Every public operation clears the flag before it starts, so a
+        failure only cuts short the operation it happened in.
+
+        Args:
+            data: Nibble (upper 4 bits) plus control bits
+            settle: Wait for command execution afterwards. Not needed
+                    after the high nibble of a byte, which the controller
+                    only latches.
         """
+        if self.io_error:
+            return
+
         try:
             # Ensure data is in upper nibble (bits 4-7)
             # Lower bits contain control signals
@@ -157,10 +189,11 @@ class LCD1602:
 
             # Step 3: Set E=0 (complete cycle)
             self.i2c.writeto(self.addr, bytes([byte_data & ~self.En]))
-            time.sleep_us(50)  # Command execution time (>37us, use 50us)
+            if settle:
+                time.sleep_us(50)  # Command execution time (>37us, use 50us)
 
         except OSError:
-            pass  # Silently fail if I2C error
+            self.io_error = True  # Reported by the public operation
     
     def _send_command(self, cmd):
         """Send command to LCD"""
@@ -174,11 +207,23 @@ class LCD1602:
         """Send byte to LCD in 4-bit mode"""
         high_bits = mode | (data & 0xF0)
         low_bits = mode | ((data << 4) & 0xF0)
-        self._write4bits(high_bits)
+        self._write4bits(high_bits, False)
         self._write4bits(low_bits)
     
     def clear(self):
-        """Clear display (blocking)"""
+        """
+        Clear display (blocking)
+
+        Raises:
+            OSError: If the I2C write failed
+        """
+        self.io_error = False
+        self._clear()
+        if self.io_error:
+            raise OSError("LCD I2C write failed")
+
+    def _clear(self):
+        """Clear display without resetting or reporting io_error"""
         self._send_command(self.LCD_CLEARDISPLAY)
         time.sleep_ms(5)  # Clear needs up to 1.52ms, use 5ms to be safe
 
@@ -189,11 +234,16 @@ class LCD1602:
         Args:
             col: Column (0-15)
             row: Row (0-1)
+
+        Raises:
+            OSError: If the I2C write failed
         """
-        row_offsets = [0x00, 0x40, 0x14, 0x54]
+        self.io_error = False
         if row >= self.rows:
             row = self.rows - 1
-        self._send_command(self.LCD_SETDDRAMADDR | (col + row_offsets[row]))
+        self._send_command(self.LCD_SETDDRAMADDR | (col + self.ROW_OFFSETS[row]))
+        if self.io_error:
+            raise OSError("LCD I2C write failed")
     
     def write_string(self, text):
         """
@@ -201,23 +251,140 @@ class LCD1602:
         
         Args:
             text: String to display
+
+        Raises:
+            OSError: If the I2C write failed
         """
+        self.io_error = False
         for char in text:
             self._send_data(ord(char))
+            if self.io_error:
+                raise OSError("LCD I2C write failed")
     
     def print(self, text, row=0):
         """
         Print text on specified row (left-aligned)
 
+        The cursor move and all characters go out in a single I2C write
+        (see _pack_row).
+
         Args:
             text: Text to display
             row: Row number (0 or 1)
+
+        Raises:
+            OSError: If the I2C write failed
+        """
+        self.io_error = False
+
+        self._pack_row(self._row_buf, 0, text, row)
+        self._burst(self._row_buf)
+
+        if self.io_error:
+            raise OSError("LCD I2C write failed")
+
+    def print_spans(self, spans):
+        """
+        Overwrite several row spans (at most one per row) in a single I2C write
+
+        Args:
+            spans: Sequence of (text, col, row) tuples. Each text is
+                   written from col with no padding, truncated at the end
+                   of the row.
+
+        Raises:
+            OSError: If the I2C write failed
+        """
+        self.io_error = False
+
+        buf = self._frame_buf
+        pos = 0
+        for text, col, row in spans:
+            pos = self._pack_at(buf, pos, text, col, row)
+        self._burst(self._frame_mv[:pos])
+
+        if self.io_error:
+            raise OSError("LCD I2C write failed")
+
+    def _pack_row(self, buf, pos, text, row):
+        """
+        Pack a full row update (cursor move + padded text) into buf
+
+        Args:
+            buf: Destination bytearray
+            pos: Offset to start packing at
+            text: Text for the row (converted, truncated and space-padded)
+            row: Row number
+
+        Returns:
+            Offset just past the packed row
         """
         # Convert to string if needed (e.g., if int or float passed)
-        text = str(text)
-        # Truncate if too long
-        text = text[:self.cols]
-        # Pad with spaces to clear previous content (MicroPython-compatible)
-        text = text + ' ' * (self.cols - len(text))
-        self.set_cursor(0, row)
-        self.write_string(text)
+        if not isinstance(text, str):
+            text = str(text)
+
+        if row >= self.rows:
+            row = self.rows - 1
+        pos = self._pack_byte(buf, pos, self.LCD_SETDDRAMADDR | self.ROW_OFFSETS[row], 0)
+
+        # Truncate to cols, then pad with spaces to clear previous content
+        # (packed directly, no sliced/padded copy of the text)
+        n = min(len(text), self.cols)
+        for i in range(n):
+            pos = self._pack_byte(buf, pos, ord(text[i]), self.Rs)
+        for _ in range(self.cols - n):
+            pos = self._pack_byte(buf, pos, 0x20, self.Rs)
+        return pos
+
+    def _pack_at(self, buf, pos, text, col, row):
+        """
+        Pack a cursor move to (col, row) plus text (no padding) into buf
+
+        Returns:
+            Offset just past the packed span
+        """
+        if row >= self.rows:
+            row = self.rows - 1
+        pos = self._pack_byte(buf, pos, self.LCD_SETDDRAMADDR | (col + self.ROW_OFFSETS[row]), 0)
+        for i in range(min(len(text), self.cols - col)):
+            pos = self._pack_byte(buf, pos, ord(text[i]), self.Rs)
+        return pos
+
+    def _pack_byte(self, buf, pos, data, mode):
+        """
+        Pack one byte as PCF8574 writes into buf (4-bit mode, 6 bytes)
+
+        Each nibble becomes the same three port states _write4bits() sends
+        (data setup with E=0, E=1, E=0), so a burst of packed bytes drives the
+        HD44780 exactly like individual writes. The I2C byte time itself
+        provides the timing: at 100-400 kHz one byte takes 22-90us, longer
+        than the E pulse width (450ns), and the three bytes between latches
+        exceed the 37us command execution time.
+
+        Returns:
+            Offset just past the packed byte
+        """
+        bits = mode | self.backlight
+        en = self.En
+
+        # High nibble (written out rather than looped: no tuple per byte)
+        b = (data & 0xF0) | bits
+        buf[pos] = b & ~en
+        buf[pos + 1] = b | en
+        buf[pos + 2] = b & ~en
+
+        # Low nibble
+        b = ((data << 4) & 0xF0) | bits
+        buf[pos + 3] = b & ~en
+        buf[pos + 4] = b | en
+        buf[pos + 5] = b & ~en
+        return pos + 6
+
+    def _burst(self, buf):
+        """Send packed port states in one I2C write (sets io_error on failure)"""
+        if self.io_error:
+            return
+        try:
+            self.i2c.writeto(self.addr, buf)
+        except OSError:
+            self.io_error = True
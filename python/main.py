@@ -301,12 +301,11 @@ async def main():
         print("[Main] Stage 8: Preloading caches...")
 
         # HTML cache
-        from server.html_cache import get_html_cache
-        html_cache = get_html_cache()
+        from server import html_cache
         html_cache.preload({
             'index': 'static/index.html',
             'tuning': 'static/tuning.html'
-        })
+        }, collect=False)  # Profile cache preload below runs the GC
         print("[Main] HTML cache preloaded")
 
         # Profile cache
@@ -332,6 +331,10 @@ async def main():
         server_task = asyncio.create_task(web_server.start_server(command_queue))
         print("[Main] Web server started")
 
+        # Data logger batch writer (status callbacks only buffer rows)
+        log_task = asyncio.create_task(data_logger.run(LOG_FLUSH_INTERVAL))
+        print("[Main] Data logger flush task started")
+
         # WiFi monitor (auto-reconnect)
         wifi_monitor_task = asyncio.create_task(wifi_mgr.monitor())
         print("[Main] WiFi monitor started")
@@ -366,7 +369,7 @@ async def main():
         # ========================================================================
         # Run all async tasks
         # ========================================================================
-        tasks = [receiver_task, server_task, wifi_monitor_task]
+        tasks = [receiver_task, server_task, wifi_monitor_task, log_task]
         if lcd_task:
             tasks.append(lcd_task)
 
@@ -8,7 +8,45 @@
 # Works as a listener for StatusReceiver - registers a callback to receive
 # status updates independently from web server.
 
+import asyncio
+import os
 import time
+from micropython import const
+
+# Rows are batched in RAM and written by the run() task in one write() +
+# flush() when the batch reaches BUFFER_LIMIT bytes or is older than
+# BUFFER_MAX_AGE seconds. If the task falls behind, rows past
+# BUFFER_MAX_FACTOR * BUFFER_LIMIT bytes are dropped (counted in dropped_rows).
+BUFFER_LIMIT = const(4096)
+BUFFER_MAX_AGE = const(60)
+BUFFER_MAX_FACTOR = const(4)
+
+# Repeated errors are only printed on these occurrences (UART prints block)
+ERROR_REPORT_COUNTS = (1, 10, 100)
+
+# Seconds between rows while TUNING (detailed response curve for PID analysis)
+TUNING_LOG_INTERVAL = const(2)
+
+# CSV row templates, bound once so each row is a single % format instead of
+# an f-string concat chain (one str per interpolation). Columns match
+# _write_header; recovery rows carry the RECOVERY state and empty step fields.
+_TS_FMT = "%04d-%02d-%02d %02d:%02d:%02d"  # YYYY-MM-DD HH:MM:SS
+_ROW_FMT = "%s,%.1f,%.2f,%.2f,%.2f,%s,%s,%s,%s,%.1f\n"
+_RECOVERY_FMT = "%s,%.1f,%.2f,%.2f,%.2f,RECOVERY,,,,%.1f\n"
+
+# CSV header row, pre-encoded (log files are opened in binary mode)
+_HEADER = (
+    b"timestamp,"
+    b"elapsed_seconds,"
+    b"current_temp_c,"
+    b"target_temp_c,"
+    b"ssr_output_percent,"
+    b"state,"
+    b"step_name,"
+    b"step_index,"
+    b"total_steps,"
+    b"measured_rate_c_per_hour\n"
+)
 
 class DataLogger:
     """
@@ -23,18 +61,33 @@ class DataLogger:
     Register with StatusReceiver to automatically receive status updates:
         receiver = get_status_receiver()
         receiver.register_listener(data_logger.on_status_update)
+
+    Status callbacks only format rows into an in-memory batch; start run()
+    as a background task to write batches to the file:
+        asyncio.create_task(data_logger.run())
     """
 
-    def __init__(self, log_dir="logs", logging_interval=30):
+    def __init__(self, log_dir="logs", logging_interval=30, buffer_limit=BUFFER_LIMIT):
         """
         Initialize data logger
 
         Args:
             log_dir: Directory to store log files (default: "logs")
             logging_interval: Seconds between log entries (default: 30)
+            buffer_limit: Bytes of rows to batch in RAM before writing
+                          (default: 4096). Batches older than BUFFER_MAX_AGE
+                          seconds are written regardless, so a crash loses
+                          at most one batch (recovery resumes from the last
+                          written row).
         """
         self.log_dir = log_dir
-        self.logging_interval = logging_interval
+        self.logging_interval = int(logging_interval)
+        self._buf = bytearray()
+        self._buf_limit = buffer_limit
+        self._buf_max = buffer_limit * BUFFER_MAX_FACTOR
+        self._last_flush = 0
+        self.dropped_rows = 0  # Rows lost because the batch hit _buf_max
+        self.error_count = 0   # Write/format errors during the current run
         self.file = None
         self.is_logging = False
         self.current_profile_name = None
@@ -42,6 +95,10 @@ class DataLogger:
         self.last_log_time = 0
         self.previous_state = None
 
+        # Last formatted row timestamp (rows within the same second reuse it)
+        self._last_ts_int = -1
+        self._last_ts_str = ""
+
         # Recovery context
         self.recovery_log_file = None
         self.recovery_info = None
@@ -58,35 +115,45 @@ class DataLogger:
             profile_name: Name of the kiln profile being run
             recovery_log_file: Optional path to existing log file to append to (for recovery)
         """
+        # Still logging (e.g. TUNING -> RUNNING): write out and close the
+        # current file before its batch is replaced
+        if self.is_logging:
+            self.stop_logging()
+
         if recovery_log_file:
             # Resume logging to existing file (program recovery)
             filename = recovery_log_file
-            mode = 'a'  # Append mode
+            mode = 'ab'  # Append mode
         else:
             # Generate filename with timestamp for new run
             timestamp_str = self._format_timestamp_filename(time.time())
             # Sanitize profile name for filename
             safe_profile_name = profile_name.replace(' ', '_').replace('/', '_')
             filename = f"{self.log_dir}/{safe_profile_name}_{timestamp_str}.csv"
-            mode = 'w'  # Write mode
+            mode = 'wb'  # Write mode
 
         try:
-            # Create log directory if it doesn't exist
+            # Create log directory if it doesn't exist (stat first so the
+            # common case doesn't raise and allocate an OSError)
             try:
-                import os
-                os.mkdir(self.log_dir)
+                os.stat(self.log_dir)
             except OSError:
-                pass  # Directory already exists
+                os.mkdir(self.log_dir)
 
-            # Open file for writing or appending
+            # Open file for writing or appending - binary, since every row
+            # is pre-encoded ASCII and text mode only adds a codec layer
             self.file = open(filename, mode)
             self.is_logging = True
             self.current_profile_name = profile_name
             self.current_filename = filename
             self.last_log_time = 0  # Reset to force first log immediately
+            self._buf = bytearray()
+            self._last_flush = time.time()
+            self.error_count = 0
+            self.dropped_rows = 0
 
             # Write CSV header only for new files
-            if mode == 'w':
+            if mode == 'wb':
                 self._write_header()
                 print(f"[DataLogger] Started logging to {filename}")
             else:
@@ -120,15 +187,19 @@ class DataLogger:
             return
 
         # Check if enough time has passed since last log
+        # (time.time() is an int on MicroPython, so this stays integer math)
         current_time = time.time()
         current_state = status['state']  # Safe: guaranteed by StatusMessage template
 
         # Use shorter interval for TUNING to capture detailed response curve
-        interval = 2.0 if current_state == 'TUNING' else self.logging_interval
+        interval = TUNING_LOG_INTERVAL if current_state == 'TUNING' else self.logging_interval
 
         if current_time - self.last_log_time < interval:
             return  # Skip this log entry
 
+        # First row of a run: written straight away (below) so a reset
+        # before the first batch still leaves a file recovery can resume
+        first_row = self.last_log_time == 0
         self.last_log_time = current_time
 
         try:
@@ -145,58 +216,60 @@ class DataLogger:
             # Use .get() for optional fields that may not exist in all status types (e.g., tuning)
             is_recovering = status.get('is_recovering', False)
 
+            # Step fields are in both the profile and tuning templates, so
+            # index them directly (a subscript is cheaper than a .get() call)
+            total_steps = status['total_steps']
+            if total_steps is None:
+                total_steps = ''  # Empty CSV field
+
             if is_recovering:
                 # In recovery mode - use special markers
                 step_name = 'RECOVERY'
                 step_index = -1
-                total_steps = status.get('total_steps') or ''  # Convert None to empty string
                 measured_rate = 0.0
             else:
                 # Normal logging - extract step info (populated for both tuning and profile runs)
-                # Use .get() for optional fields that may not be present in all status types
-                step_name = status.get('step_name') or ''  # Convert None to empty string
-                step_index = str(status.get('step_index')) if status.get('step_index') is not None else ''
-                total_steps = status.get('total_steps') or ''
+                step_name = status['step_name']
+                if step_name is None:
+                    step_name = ''
+                step_index = status['step_index']
+                if step_index is None:
+                    step_index = ''  # Otherwise left as int for %s
+                # measured_rate is not in the tuning template
                 measured_rate = status.get('measured_rate', 0)
 
-            # Format row - use simple string concatenation for MicroPython compatibility
-            timestamp_iso = self._format_timestamp_iso(timestamp)
+            # Format timestamp inline (hot path); rows within the same
+            # second reuse the last string and skip localtime()
+            ts_int = int(timestamp)
+            if ts_int == self._last_ts_int:
+                timestamp_iso = self._last_ts_str
+            else:
+                # MicroPython's time.localtime() returns tuple:
+                # (year, month, day, hour, minute, second, weekday, yearday)
+                timestamp_iso = _TS_FMT % time.localtime(ts_int)[:6]
+                self._last_ts_int = ts_int
+                self._last_ts_str = timestamp_iso
 
-            # Build CSV line (MicroPython-compatible approach)
+            # Build CSV line
             # Note: Removed progress_percent column (no longer in StatusMessage)
-            row = (
-                f"{timestamp_iso},"
-                f"{elapsed:.1f},"
-                f"{current_temp:.2f},"
-                f"{target_temp:.2f},"
-                f"{ssr_output:.2f},"
-                f"{state},"
-                f"{step_name if step_name else ''},"
-                f"{step_index if step_index is not None and step_index != '' else ''},"
-                f"{total_steps if total_steps is not None and total_steps != '' else ''},"
-                f"{measured_rate:.1f}\n"
+            row = _ROW_FMT % (
+                timestamp_iso, elapsed, current_temp, target_temp, ssr_output,
+                state, step_name, step_index, total_steps, measured_rate
             )
 
-            # Write to file
-            self.file.write(row)
-            self.file.flush()  # Ensure data is written to disk
+            # Hand the row to the run() task; no file I/O on the callback path
+            # after the first row
+            if len(self._buf) < self._buf_max:
+                self._buf.extend(row.encode())
+                if first_row:
+                    self._flush_buffer()
+            else:
+                self.dropped_rows += 1
+                if self.dropped_rows in ERROR_REPORT_COUNTS:
+                    print(f"[DataLogger] Log batch full, dropped {self.dropped_rows} row(s) so far")
 
         except Exception as e:
-            print(f"[DataLogger] Error writing log entry: {e}")
-            # Try to recover the file handle
-            if not self._recover_file_handle():
-                print(f"[DataLogger] Failed to recover - logging stopped")
-                return
-            # Try writing again after recovery
-            try:
-                self.file.write(row)
-                self.file.flush()
-                print(f"[DataLogger] Successfully wrote after recovery")
-            except Exception as e2:
-                print(f"[DataLogger] Write failed after recovery: {e2}")
-                self.is_logging = False
-                self.file = None
-                self.current_filename = None
+            self._report_error("Error writing log entry", e)
 
     def log_recovery_event(self, recovery_info, current_status):
         """
@@ -224,44 +297,22 @@ class DataLogger:
             # Extract rate info
             measured_rate = current_status['measured_rate']
 
-            # Format row with RECOVERY marker in state column
-            timestamp_iso = self._format_timestamp_iso(timestamp)
+            timestamp_iso = _TS_FMT % time.localtime(int(timestamp))[:6]
 
-            # Build CSV line (MicroPython-compatible approach)
+            # Build CSV line with the RECOVERY marker in the state column
             # Note: Removed progress_percent column (no longer in StatusMessage)
-            row = (
-                f"{timestamp_iso},"
-                f"{elapsed:.1f},"
-                f"{current_temp:.2f},"
-                f"{target_temp:.2f},"
-                f"{ssr_output:.2f},"
-                f"RECOVERY,"  # Special state marker
-                f",,,"  # Empty step fields for recovery events
-                f"{measured_rate:.1f}\n"
+            row = _RECOVERY_FMT % (
+                timestamp_iso, elapsed, current_temp, target_temp, ssr_output,
+                measured_rate
             )
 
-            # Write to file
-            self.file.write(row)
-            self.file.flush()  # Ensure data is written to disk
-
-            print(f"[DataLogger] Recovery event logged at {elapsed:.1f}s")
+            # Recovery markers must be durable: write the batch out now
+            self._buf.extend(row.encode())
+            if self._flush_buffer():
+                print(f"[DataLogger] Recovery event logged at {elapsed:.1f}s")
 
         except Exception as e:
-            print(f"[DataLogger] Error writing recovery event: {e}")
-            # Try to recover the file handle
-            if not self._recover_file_handle():
-                print(f"[DataLogger] Failed to recover - logging stopped")
-                return
-            # Try writing again after recovery
-            try:
-                self.file.write(row)
-                self.file.flush()
-                print(f"[DataLogger] Successfully wrote recovery event after file recovery")
-            except Exception as e2:
-                print(f"[DataLogger] Write failed after recovery: {e2}")
-                self.is_logging = False
-                self.file = None
-                self.current_filename = None
+            self._report_error("Error writing recovery event", e)
 
     def stop_logging(self):
         """
@@ -271,9 +322,14 @@ class DataLogger:
             return
 
         try:
+            if self.file:
+                self._flush_buffer()
+
             if self.file:
                 self.file.close()
                 print(f"[DataLogger] Stopped logging for {self.current_profile_name}")
+                if self.dropped_rows:
+                    print(f"[DataLogger] WARNING: {self.dropped_rows} row(s) dropped during this run")
 
             self.file = None
             self.is_logging = False
@@ -293,6 +349,10 @@ class DataLogger:
         Args:
             recovery_info: RecoveryInfo object with recovery details
         """
+        # Push any buffered rows to disk before switching files
+        if self.file:
+            self._flush_buffer()
+
         self.recovery_log_file = recovery_info.log_file
         self.recovery_info = recovery_info
         print(f"[DataLogger] Recovery context set: will resume to {recovery_info.log_file}")
@@ -311,6 +371,11 @@ class DataLogger:
         """
         # Safe: Fields guaranteed by StatusMessage template
         current_state = status['state']
+
+        # Fast path: idle and staying idle (the common case) - nothing to do
+        if current_state == self.previous_state and current_state not in ('RUNNING', 'TUNING'):
+            return
+
         profile_name = status['profile_name']
 
         # Start logging when entering RUNNING state
@@ -353,52 +418,99 @@ class DataLogger:
 
     def _write_header(self):
         """Write CSV header row"""
-        header = (
-            "timestamp,"
-            "elapsed_seconds,"
-            "current_temp_c,"
-            "target_temp_c,"
-            "ssr_output_percent,"
-            "state,"
-            "step_name,"
-            "step_index,"
-            "total_steps,"
-            "measured_rate_c_per_hour\n"
-        )
-        self.file.write(header)
+        self.file.write(_HEADER)
         self.file.flush()
 
-    def _format_timestamp_iso(self, unix_timestamp):
+    def _format_timestamp_filename(self, unix_timestamp):
         """
-        Format unix timestamp as ISO-like string for CSV
+        Format unix timestamp for use in filename
 
-        Format: YYYY-MM-DD HH:MM:SS
+        Format: YYYY-MM-DD_HH-MM-SS
 
         Args:
             unix_timestamp: Unix timestamp (seconds since epoch)
 
         Returns:
-            ISO-formatted timestamp string
+            Filename-safe timestamp string
         """
-        # MicroPython's time.localtime() returns tuple:
-        # (year, month, day, hour, minute, second, weekday, yearday)
         t = time.localtime(unix_timestamp)
-        return f"{t[0]:04d}-{t[1]:02d}-{t[2]:02d} {t[3]:02d}:{t[4]:02d}:{t[5]:02d}"
+        return f"{t[0]:04d}-{t[1]:02d}-{t[2]:02d}_{t[3]:02d}-{t[4]:02d}-{t[5]:02d}"
 
-    def _format_timestamp_filename(self, unix_timestamp):
+    async def run(self, flush_interval=10):
         """
-        Format unix timestamp for use in filename
+        Background task that writes batched rows to the log file
 
-        Format: YYYY-MM-DD_HH-MM-SS
+        Checks the batch every flush_interval seconds and writes it once it
+        reaches buffer_limit bytes or BUFFER_MAX_AGE seconds have passed
+        since the last write. State transitions (stop, recovery) still write their
+        batch immediately.
 
         Args:
-            unix_timestamp: Unix timestamp (seconds since epoch)
+            flush_interval: Seconds between batch checks (default: 10)
+        """
+        print("[DataLogger] Flush task running...")
+
+        while True:
+            await asyncio.sleep(flush_interval)
+
+            if not self.file or not self._buf:
+                continue
+
+            if (len(self._buf) >= self._buf_limit
+                    or time.time() - self._last_flush >= BUFFER_MAX_AGE):
+                self._flush_buffer()
+
+    def _flush_buffer(self):
+        """
+        Write batched rows to the log file in one write() + flush()
+
+        On a write error the file handle is recovered and the same batch is
+        retried once; if that fails too, logging is stopped.
 
         Returns:
-            Filename-safe timestamp string
+            True if the batch reached the file (or was empty), False otherwise
         """
-        t = time.localtime(unix_timestamp)
-        return f"{t[0]:04d}-{t[1]:02d}-{t[2]:02d}_{t[3]:02d}-{t[4]:02d}-{t[5]:02d}"
+        if not self._buf:
+            return True
+
+        try:
+            self.file.write(self._buf)
+            self.file.flush()
+        except Exception as e:
+            self._report_error("Error writing log batch", e)
+            # Try to recover the file handle
+            if not self._recover_file_handle():
+                print(f"[DataLogger] Failed to recover - logging stopped")
+                self._buf = bytearray()
+                return False
+            # Try writing again after recovery
+            try:
+                self.file.write(self._buf)
+                self.file.flush()
+                print(f"[DataLogger] Successfully wrote after recovery")
+            except Exception as e2:
+                print(f"[DataLogger] Write failed after recovery: {e2}")
+                self.is_logging = False
+                self.file = None
+                self.current_filename = None
+                self._buf = bytearray()
+                return False
+
+        self._buf = bytearray()
+        self._last_flush = time.time()
+        return True
+
+    def _report_error(self, message, error):
+        """
+        Count an error and print it only on the 1st, 10th and 100th occurrence
+
+        Args:
+            message: Short description of the failed operation
+            error: The exception that was raised
+        """
+        self.error_count += 1
+        if self.error_count in ERROR_REPORT_COUNTS:
+            print(f"[DataLogger] {message}: {error} (error #{self.error_count})")
 
     def _recover_file_handle(self):
         """
@@ -428,7 +540,7 @@ class DataLogger:
 
         # Try to reopen the file in append mode
         try:
-            self.file = open(self.current_filename, 'a')
+            self.file = open(self.current_filename, 'ab')
             print(f"[DataLogger] Successfully recovered file handle for {self.current_filename}")
             return True
         except Exception as e:
@@ -3,156 +3,294 @@
 #
 # This module pre-loads static HTML files at startup and serves them from RAM,
 # preventing event loop blocking during request handling.
+#
+# Pages are cached as bytes so they can be written to the socket as-is,
+# without a UTF-8 encode (and a transient copy) on every request. Each page
+# is also kept as a list of CHUNK_SIZE memoryview slices over those bytes.
+#
+# The cache is plain module state with free functions (there is only ever
+# one), so a request handler's lookup is a module attribute and a dict get:
+#     from server import html_cache
+#     chunks = html_cache.get_chunks('index')
 
 import gc
+import os
+from micropython import const
 
-class HTMLCache:
-    """
-    Singleton cache for static HTML files
+# Cached pages are also pre-sliced into memoryviews of this size, so the
+# web server can write them chunk by chunk without copying (matches the
+# web server's 1 KiB FILE_CHUNK_SIZE)
+CHUNK_SIZE = const(1024)
+
+_cache = {}
+_chunks = {}       # key -> list of memoryview slices over _cache[key]
+_paths = {}        # key -> file path the page was loaded from
+_rendered = set()  # keys whose cached page is a prerender() result
 
-    Pre-loads HTML files into memory at startup to avoid blocking file I/O
-    during request handling, which would freeze the async event loop.
+
+def _compile_template(template, placeholders):
     """
+    Split a template into literal segments around its placeholders
 
-    _instance = None
+    Args:
+        template: Template bytes
+        placeholders: Iterable of placeholder bytes (e.g., b'{profiles_list}')
 
-    def __new__(cls):
-        """Singleton pattern - only one instance allowed"""
-        if cls._instance is None:
-            cls._instance = super(HTMLCache, cls).__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
+    Returns:
+        Tuple (segments, holders) where len(segments) == len(holders) + 1 and
+        the rendered output is segments[0] + value(holders[0]) + segments[1] ...
+    """
+    segments = []
+    holders = []
+    pos = 0
 
-    def __init__(self):
-        """Initialize the HTML cache (only runs once due to singleton)"""
-        if self._initialized:
-            return
+    while True:
+        # Next placeholder occurrence (earliest across all placeholders)
+        best = -1
+        best_holder = None
+        for holder in placeholders:
+            i = template.find(holder, pos)
+            if i != -1 and (best == -1 or i < best):
+                best = i
+                best_holder = holder
 
-        self._cache = {}
-        self._initialized = True
-        print("[HTMLCache] Singleton instance created")
+        if best == -1:
+            break
 
-    def preload(self, files):
-        """
-        Pre-load HTML files into memory
+        segments.append(template[pos:best])
+        holders.append(best_holder)
+        pos = best + len(best_holder)
 
-        Args:
-            files: Dictionary mapping cache keys to file paths
-                   e.g., {'index': 'static/index.html', 'tuning': 'static/tuning.html'}
+    segments.append(template[pos:])
+    return segments, holders
 
-        Returns:
-            Number of files successfully loaded
-        """
-        loaded = 0
 
-        for key, filepath in files.items():
-            try:
-                with open(filepath, 'r') as f:
-                    content = f.read()
+def preload(files, collect=True, verbose=False):
+    """
+    Pre-load HTML files into memory
+
+    Args:
+        files: Dictionary mapping cache keys to file paths
+               e.g., {'index': 'static/index.html', 'tuning': 'static/tuning.html'}
+        collect: Run gc.collect() afterwards and report free memory
+                 (default: True). Pass False when loading several caches
+                 back-to-back and collect once at the end.
+        verbose: Also report each loaded file (default: False). Log
+                 lines are collected and printed in one call at the end,
+                 since every print() is a blocking UART write.
 
-                self._cache[key] = content
+    Returns:
+        Number of files successfully loaded
+    """
+    loaded = 0
+    lines = []
+
+    for key, filepath in files.items():
+        try:
+            content = _read_file(filepath)
+            _cache[key] = content
+            _chunks[key] = _slice(content)
+            _paths[key] = filepath
+            _rendered.discard(key)
+            if verbose:
                 size_kb = len(content) / 1024
-                print(f"[HTMLCache] Loaded '{key}' from {filepath} ({size_kb:.1f} KB)")
-                loaded += 1
+                lines.append(f"[HTMLCache] Loaded '{key}' from {filepath} ({size_kb:.1f} KB)")
+            loaded += 1
 
-            except OSError as e:
-                print(f"[HTMLCache] WARNING: Failed to load {filepath}: {e}")
+        except OSError as e:
+            lines.append(f"[HTMLCache] WARNING: Failed to load {filepath}: {e}")
 
+    if collect:
         # Force GC after loading to clean up temporary objects
         gc.collect()
-        free_mem = gc.mem_free()
-        print(f"[HTMLCache] Pre-loaded {loaded}/{len(files)} files, free memory: {free_mem}")
+        lines.append(f"[HTMLCache] Pre-loaded {loaded}/{len(files)} files, free memory: {gc.mem_free()}")
+    else:
+        lines.append(f"[HTMLCache] Pre-loaded {loaded}/{len(files)} files")
 
-        return loaded
+    print('\n'.join(lines))
 
-    def render_profiles_list(self, profile_names):
-        """
-        Render profiles list HTML for index page
+    return loaded
 
-        Args:
-            profile_names: List of profile names
 
-        Returns:
-            HTML string for profiles list
-        """
-        if not profile_names:
-            return '<ul><li>No profiles found</li></ul>'
+def render_profiles_list(profile_names):
+    """
+    Render profiles list HTML for index page
 
-        parts = ['<ul>']
-        for name in profile_names:
-            parts.append(f'<li>{name} <button onclick="startProfile(\'{name}\')">Start</button></li>')
-        parts.append('</ul>')
+    Args:
+        profile_names: Sequence of profile names (list or tuple)
 
-        return ''.join(parts)
+    Returns:
+        HTML bytes for profiles list
+    """
+    if not profile_names:
+        html = b'<ul><li>No profiles found</li></ul>'
+    else:
+        # Sized up front so the loop never triggers a list resize
+        n = len(profile_names)
+        parts = [None] * (n + 2)
+        parts[0] = '<ul>'
+        for i in range(n):
+            name = profile_names[i]
+            parts[i + 1] = f'<li>{name} <button onclick="startProfile(\'{name}\')">Start</button></li>'
+        parts[n + 1] = '</ul>'
+        html = ''.join(parts).encode()
+
+    return html
+
+
+def render_template(key, replacements):
+    """
+    Render cached template with replacements
 
-    def render_template(self, key, replacements):
-        """
-        Render cached template with replacements
+    The template is split into literal segments around the placeholders
+    it actually contains, so each render is a single join instead of one
+    full str.replace() pass per placeholder. Nothing is kept between
+    calls: once a page has been pre-rendered, its template is read back
+    from the file for the next render (e.g. after the profile list
+    changes) instead of being pinned in RAM.
 
-        Args:
-            key: Cache key (e.g., 'index')
-            replacements: Dict of {placeholder: value} to replace
+    Args:
+        key: Cache key (e.g., 'index')
+        replacements: Dict of {placeholder: value} to replace
+                      (str or bytes; str is encoded as UTF-8)
 
-        Returns:
-            Rendered HTML string, or None if key not found
-        """
-        template = self._cache.get(key)
-        if not template:
+    Returns:
+        Rendered HTML bytes, or None if key not found
+    """
+    values = {}
+    for placeholder, value in replacements.items():
+        if isinstance(placeholder, str):
+            placeholder = placeholder.encode()
+        if isinstance(value, str):
+            value = value.encode()
+        values[placeholder] = value
+
+    if key in _rendered:
+        try:
+            template = _read_file(_paths[key])
+        except OSError as e:
+            print(f"[HTMLCache] WARNING: Failed to re-read template '{key}': {e}")
             return None
+    else:
+        template = _cache.get(key)
+    if not template:
+        return None
+
+    segments, holders = _compile_template(template, values)
+    out = []
+    for i in range(len(holders)):
+        out.append(segments[i])
+        h = holders[i]
+        out.append(values.get(h, h))
+    out.append(segments[-1])
+
+    return b''.join(out)
+
+
+def prerender(key, replacements):
+    """
+    Pre-render a template and cache the result
+
+    Args:
+        key: Cache key for template
+        replacements: Dict of {placeholder: value} to replace
+
+    Returns:
+        True if successful, False otherwise
+    """
+    rendered = render_template(key, replacements)
+    if rendered:
+        _cache[key] = rendered
+        _chunks[key] = _slice(rendered)
+        _rendered.add(key)
+        print(f"[HTMLCache] Pre-rendered '{key}' with {len(replacements)} replacements")
+        return True
+    return False
+
+
+def get(key):
+    """
+    Get cached HTML content as a string
+
+    Decodes on every call; request handlers should use get_bytes().
+
+    Args:
+        key: Cache key (e.g., 'index', 'tuning')
+
+    Returns:
+        HTML content string, or None if not found
+    """
+    content = _cache.get(key)
+    return content.decode() if content is not None else None
 
-        html = template
-        for placeholder, value in replacements.items():
-            html = html.replace(placeholder, value)
-
-        return html
-
-    def prerender(self, key, replacements):
-        """
-        Pre-render a template and cache the result
-
-        Args:
-            key: Cache key for template
-            replacements: Dict of {placeholder: value} to replace
-
-        Returns:
-            True if successful, False otherwise
-        """
-        rendered = self.render_template(key, replacements)
-        if rendered:
-            self._cache[key] = rendered
-            print(f"[HTMLCache] Pre-rendered '{key}' with {len(replacements)} replacements")
-            return True
-        return False
-
-    def get(self, key):
-        """
-        Get cached HTML content
-
-        Args:
-            key: Cache key (e.g., 'index', 'tuning')
-
-        Returns:
-            HTML content string, or None if not found
-        """
-        return self._cache.get(key)
-
-    def clear(self):
-        """Clear all cached content (frees memory)"""
-        count = len(self._cache)
-        self._cache.clear()
-        gc.collect()
-        print(f"[HTMLCache] Cleared {count} cached files")
 
+def get_bytes(key):
+    """
+    Get cached HTML content as bytes, ready to write to the socket
+
+    Args:
+        key: Cache key (e.g., 'index', 'tuning')
 
-# Global singleton instance
-_cache = HTMLCache()
+    Returns:
+        HTML content (bytes, or the bytearray a page was loaded into),
+        or None if not found
+    """
+    return _cache.get(key)
 
 
-def get_html_cache():
+def get_chunks(key):
     """
-    Get the global HTMLCache singleton instance
+    Get cached HTML content as pre-sliced memoryview chunks
+
+    The chunks view the bytes held in the cache, so writing them to a
+    socket needs no slicing or copying per request.
+
+    Args:
+        key: Cache key (e.g., 'index', 'tuning')
 
     Returns:
-        HTMLCache instance
+        List of memoryview chunks, or None if not found
     """
-    return _cache
+    return _chunks.get(key)
+
+
+def _read_file(filepath):
+    """
+    Read a file into an exact-size bytearray with a single readinto()
+
+    One allocation per file, no growing read buffer.
+
+    Raises:
+        OSError: If the file cannot be stat'ed or read
+    """
+    size = os.stat(filepath)[6]
+    content = bytearray(size)
+    with open(filepath, 'rb') as f:
+        n = f.readinto(content)
+    if n != size:
+        content = content[:n]  # File shrank since stat()
+    return content
+
+
+def _slice(content):
+    """Slice cached bytes into CHUNK_SIZE memoryviews"""
+    mv = memoryview(content)
+    return [mv[i:i + CHUNK_SIZE] for i in range(0, len(content), CHUNK_SIZE)]
+
+
+def clear(collect=False):
+    """
+    Clear all cached content (frees memory)
+
+    Args:
+        collect: Run gc.collect() right away (default: False). Otherwise
+                 the memory is reclaimed by the next collection.
+    """
+    count = len(_cache)
+    _cache.clear()
+    _chunks.clear()
+    _paths.clear()
+    _rendered.clear()
+    if collect:
+        gc.collect()
+    print(f"[HTMLCache] Cleared {count} cached files")
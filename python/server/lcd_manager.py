@@ -10,6 +10,28 @@
 import asyncio
 import time
 from machine import I2C, Pin
+from micropython import const
+
+# Row templates (% formatting: smaller bytecode than f-strings on MicroPython)
+ROW1_FMT = "%4.0fC %s"                   # "  25C IDLE"
+ROW2_TARGET_FMT = "Tgt:%4.0fC %3.0f%%"   # "Tgt: 800C  45%"
+ROW2_SSR_FMT = "SSR: %3.0f%%"            # "SSR:   0%"
+
+# Status fields shown on the LCD, and their defaults if missing
+STATUS_FIELDS = ('state', 'current_temp', 'target_temp', 'ssr_output')
+STATUS_DEFAULTS = ('IDLE', 0.0, 0.0, 0.0)
+
+# What a row shows after initialize() clears the display
+BLANK_ROW = " " * 16
+
+# Default I2C clock when config.LCD_I2C_FREQ is unset (standard mode, same
+# default as the Rust firmware's KilnConfig)
+LCD_I2C_FREQ = 100000
+
+# Loop timings (const: folded into the bytecode on MicroPython)
+UPDATE_INTERVAL_MS = const(5000)   # Display refresh period
+ERROR_BACKOFF_MS = const(1000)     # Back-off after a failed update
+MAX_CONSECUTIVE_ERRORS = const(3)  # Disable the LCD after this many failures
 
 
 class LCDManager:
@@ -34,27 +56,53 @@ class LCDManager:
         self.config = config
         self.status_receiver = status_receiver
         
-        # Check if LCD is enabled in config
-        self.enabled = hasattr(config, 'LCD_I2C_SCL') and hasattr(config, 'LCD_I2C_SDA')
+        # Check if LCD is enabled in config (explicit LCD_ENABLED flag;
+        # configs predating it are enabled by having the I2C pins defined)
+        enabled = getattr(config, 'LCD_ENABLED', None)
+        if enabled is None:
+            enabled = getattr(config, 'LCD_I2C_SCL', None) is not None and \
+                getattr(config, 'LCD_I2C_SDA', None) is not None
+        self.enabled = enabled
         
         if not self.enabled:
             print("[LCD] LCD not configured, display disabled")
             self.lcd = None
             return
         
-        # Hardware component (initialized separately via initialize_hardware)
+        # I2C settings, probed from config once (reused by every reset).
+        # Defaults match the Rust firmware's KilnConfig, so LCD_ENABLED = True
+        # with no pins given still works.
+        self._i2c_id = getattr(config, 'LCD_I2C_ID', 0)
+        self._i2c_scl = getattr(config, 'LCD_I2C_SCL', 21)
+        self._i2c_sda = getattr(config, 'LCD_I2C_SDA', 20)
+        self._i2c_addr = getattr(config, 'LCD_I2C_ADDR', 0x27)
+        self._i2c_freq = getattr(config, 'LCD_I2C_FREQ', LCD_I2C_FREQ)
+
+        # Hardware components (initialized separately via initialize_hardware)
         self.lcd = None
+        self._i2c = None
+        # Set once initialize_hardware() has succeeded or given up
+        self._init_done = asyncio.Event()
+
+        # Padded text shown on each row (skip I2C writes for unchanged
+        # columns; None forces a full row write)
+        self._last_rows = [BLANK_ROW, BLANK_ROW]
         
         # Periodic reset tracking (to handle wire interference issues)
         self.last_reset_time = 0
         self.reset_interval_sec = 300  # 5 minutes = 300 seconds
 
-    async def initialize_hardware(self, timeout_ms=500):
+    async def initialize_hardware(self, timeout_ms=500, rebuild_bus=False, disable_on_failure=True):
         """
         Initialize LCD hardware (async, non-blocking)
         
         Args:
             timeout_ms: Timeout in milliseconds (default: 500ms)
+            rebuild_bus: Recreate the I2C bus object instead of reusing it
+                         (recovers a peripheral wedged by wire interference)
+            disable_on_failure: Disable the LCD if initialization fails
+                                (default: True). Resets pass False and let
+                                run() count the failure instead.
         
         Returns:
             True if initialization successful, False otherwise
@@ -65,26 +113,34 @@ class LCDManager:
         print(f"[LCD] Initializing hardware with {timeout_ms}ms timeout...")
         
         try:
-            # Initialize I2C
-            i2c = I2C(
-                self.config.LCD_I2C_ID,
-                scl=Pin(self.config.LCD_I2C_SCL),
-                sda=Pin(self.config.LCD_I2C_SDA),
-                freq=self.config.LCD_I2C_FREQ
-            )
+            # Initialize I2C once; periodic resets reuse the same bus object,
+            # error-driven resets rebuild it
+            i2c = self._i2c
+            if i2c is None or rebuild_bus:
+                i2c = I2C(
+                    self._i2c_id,
+                    scl=Pin(self._i2c_scl),
+                    sda=Pin(self._i2c_sda),
+                    freq=self._i2c_freq
+                )
+                self._i2c = i2c
             
-            # Test I2C bus by scanning for device
-            devices = i2c.scan()
-            if self.config.LCD_I2C_ADDR not in devices:
-                print(f"[LCD] WARNING: Device not found at 0x{self.config.LCD_I2C_ADDR:02x}")
-                print(f"[LCD] Found devices: {[hex(d) for d in devices]}")
-                raise Exception(f"LCD not found on I2C bus at 0x{self.config.LCD_I2C_ADDR:02x}")
+            addr = self._i2c_addr
+
+            # Probe the configured address with an empty write (one bus
+            # transaction); only scan the whole bus to report what is there
+            try:
+                i2c.writeto(addr, b'')
+            except OSError:
+                print(f"[LCD] WARNING: Device not found at 0x{addr:02x}")
+                print(f"[LCD] Found devices: {[hex(d) for d in i2c.scan()]}")
+                raise Exception(f"LCD not found on I2C bus at 0x{addr:02x}")
             
-            print(f"[LCD] Device detected at 0x{self.config.LCD_I2C_ADDR:02x}")
+            print(f"[LCD] Device detected at 0x{addr:02x}")
             
             # Create LCD object
             from lib.lcd1602_i2c import LCD1602
-            self.lcd = LCD1602(i2c, addr=self.config.LCD_I2C_ADDR)
+            self.lcd = LCD1602(i2c, addr=addr)
             
             # Initialize LCD hardware with timeout
             await asyncio.wait_for(
@@ -94,41 +150,108 @@ class LCDManager:
             
             # Update reset timestamp
             self.last_reset_time = time.time()
+
+            # Display was cleared by initialize(): diff against blank rows
+            self._last_rows = [BLANK_ROW, BLANK_ROW]
             
             print(f"[LCD] Display initialized successfully")
+            self._init_done.set()
             return True
             
         except asyncio.TimeoutError:
             print(f"[LCD] CRITICAL: Hardware initialization TIMED OUT after {timeout_ms}ms")
-            print("[LCD] Display disabled - system will continue without LCD")
-            self.lcd = None
-            self.enabled = False
-            return False
             
         except Exception as e:
             print(f"[LCD] CRITICAL: Failed to initialize LCD hardware: {e}")
+
+        if disable_on_failure:
             print("[LCD] Display disabled - system will continue without LCD")
             self.lcd = None
             self.enabled = False
-            return False
+            self._init_done.set()
+        else:
+            # Display contents unknown after a partial init: redraw fully
+            self._last_rows = [None, None]
+        return False
 
-    async def _reset_lcd_hardware(self):
+    async def _reset_lcd_hardware(self, rebuild_bus=False):
         """
         Reset LCD hardware (handles wire interference issues)
         
         Reinitializes the LCD hardware to recover from I2C communication issues
         that can occur due to wire interference or unstable connections.
+
+        Args:
+            rebuild_bus: Also recreate the I2C bus object (used after errors)
+
+        Returns:
+            True if the reset succeeded. A failed reset leaves the LCD
+            enabled; run() counts it as an error.
         """
-        print("[LCD] Performing periodic hardware reset (10min interval)")
-        try:
-            # Re-initialize the LCD hardware
-            success = await self.initialize_hardware(timeout_ms=500)
-            if success:
-                print("[LCD] Hardware reset successful")
-            else:
-                print("[LCD] Hardware reset failed - LCD may be disabled")
-        except Exception as e:
-            print(f"[LCD] Error during hardware reset: {e}")
+        print("[LCD] Performing hardware reset")
+        success = await self.initialize_hardware(
+            timeout_ms=500, rebuild_bus=rebuild_bus, disable_on_failure=False)
+        if success:
+            print("[LCD] Hardware reset successful")
+        else:
+            print("[LCD] Hardware reset failed")
+        return success
+
+    def _row_span(self, text, row):
+        """
+        Find the part of a row that differs from what is displayed
+
+        Args:
+            text: Row text, padded to 16 columns
+            row: Row number (0 or 1)
+
+        Returns:
+            (text, col, row) span to rewrite, or None if unchanged
+        """
+        last = self._last_rows[row]
+        if last == text:
+            return None
+        if last is None:
+            return (text, 0, row)
+        start = 0
+        while text[start] == last[start]:
+            start += 1
+        end = 16
+        while text[end - 1] == last[end - 1]:
+            end -= 1
+        return (text[start:end], start, row)
+
+    def _write_frame(self, row1, row2):
+        """
+        Update both rows in one I2C write, sending only the changed columns
+
+        Args:
+            row1: Text for row 0 (truncated to 16 columns)
+            row2: Text for row 1 (truncated to 16 columns)
+        """
+        # Compare space-padded, which is what the display actually shows
+        row1 = (row1 + BLANK_ROW)[:16]
+        row2 = (row2 + BLANK_ROW)[:16]
+        span1 = self._row_span(row1, 0)
+        span2 = self._row_span(row2, 1)
+        if span1 is None:
+            if span2 is None:
+                return
+            spans = (span2,)
+        elif span2 is None:
+            spans = (span1,)
+        else:
+            spans = (span1, span2)
+
+        # Unknown until the write succeeds (a failed write may be partial)
+        last_rows = self._last_rows
+        for span in spans:
+            last_rows[span[2]] = None
+        # Raises OSError on an I2C failure (the driver stops at the first
+        # failed write); run() counts it, resets, then disables the LCD
+        self.lcd.print_spans(spans)
+        last_rows[0] = row1
+        last_rows[1] = row2
 
     async def run(self):
         """
@@ -147,16 +270,38 @@ class LCDManager:
             print("[LCD] LCD manager not enabled, exiting")
             return
         
-        # Wait for LCD hardware to be initialized
-        while not self.lcd:
-            await asyncio.sleep(0.1)
+        # Wait (without polling) for LCD hardware init to succeed or give up
+        await self._init_done.wait()
+        if not self.lcd:
+            print("[LCD] Hardware unavailable, exiting")
+            return
         
         print("[LCD] Starting LCD update loop (display-only mode)")
         print("[LCD] Showing: Temp, State, Target, SSR")
         print("[LCD] Periodic reset: every 10 minutes")
         
         consecutive_errors = 0
-        max_consecutive_errors = 3
+
+        # Bind loop-invariant lookups once (locals are LOAD_FAST on MicroPython)
+        get_status_values = self.status_receiver.get_status_values
+        write_frame = self._write_frame
+        sleep_ms = asyncio.sleep_ms
+        now = time.time
+        reset_interval = self.reset_interval_sec
+        ticks_ms = time.ticks_ms
+        ticks_add = time.ticks_add
+        ticks_diff = time.ticks_diff
+
+        # Filled in place by every status snapshot (no list per frame)
+        status_values = [None] * len(STATUS_FIELDS)
+
+        # State text trimmed to fit row 1, re-sliced only when state changes
+        last_state = None
+        state_text = ''
+
+        # Absolute frame deadline: the period does not drift with the time
+        # spent on I2C writes and status lookups
+        next_tick = ticks_ms()
         
         while True:
             try:
@@ -166,59 +311,70 @@ class LCDManager:
                     return
                 
                 # Check if periodic reset is needed (every 10 minutes)
-                current_time = time.time()
-                if current_time - self.last_reset_time >= self.reset_interval_sec:
-                    await self._reset_lcd_hardware()
+                if now() - self.last_reset_time >= reset_interval:
+                    # A failed reset counts towards MAX_CONSECUTIVE_ERRORS;
+                    # last_reset_time is unchanged, so it is retried next pass
+                    if not await self._reset_lcd_hardware():
+                        raise OSError("LCD hardware reset failed")
                     # Continue to next iteration after reset
                     continue
                 
-                # Get current status from cache
-                state = self.status_receiver.get_status_field('state', 'IDLE')
-                current_temp = self.status_receiver.get_status_field('current_temp', 0.0)
-                target_temp = self.status_receiver.get_status_field('target_temp', 0.0)
-                ssr_output = self.status_receiver.get_status_field('ssr_output', 0.0)
-                
+                # Get current status from cache (one locked snapshot per
+                # frame, unpacked straight into locals)
+                state, current_temp, target_temp, ssr_output = \
+                    get_status_values(STATUS_FIELDS, STATUS_DEFAULTS, status_values)
+
                 # Row 1: Current temp + state
                 # Format: "123C RUNNING" or "  25C IDLE"
-                row1 = f"{current_temp:4.0f}C {state[:10]}"
-                self.lcd.print(row1, row=0)
-                
-                # Small delay between row updates for reliability
-                await asyncio.sleep(0.01)
-                
+                if state is not last_state:
+                    last_state = state
+                    state_text = state[:10]
+                row1 = ROW1_FMT % (current_temp, state_text)
+
                 # Row 2: Target temp + SSR output
                 # Format: "Tgt:800C  45%" or "SSR:   0%" (when no target)
                 if target_temp > 0:
-                    row2 = f"Tgt:{target_temp:4.0f}C {ssr_output:3.0f}%"
+                    row2 = ROW2_TARGET_FMT % (target_temp, ssr_output)
                 else:
-                    row2 = f"SSR: {ssr_output:3.0f}%"
-                self.lcd.print(row2, row=1)
+                    row2 = ROW2_SSR_FMT % ssr_output
+
+                # Both rows go out in one I2C burst; _write_frame() diffs the
+                # text against the display, so an unchanged frame sends nothing
+                write_frame(row1, row2)
                 
                 # Reset error counter on successful update
                 consecutive_errors = 0
                 
                 # Update every 5 seconds
-                await asyncio.sleep(5.0)
+                next_tick = ticks_add(next_tick, UPDATE_INTERVAL_MS)
+                delay = ticks_diff(next_tick, ticks_ms())
+                if delay > 0:
+                    await sleep_ms(delay)
+                else:
+                    # Fell behind (slow reset or error back-off): resync
+                    # rather than drawing catch-up frames back to back
+                    next_tick = ticks_ms()
+                    await sleep_ms(0)
                 
             except Exception as e:
                 consecutive_errors += 1
-                print(f"[LCD] Error in update loop ({consecutive_errors}/{max_consecutive_errors}): {e}")
+                print(f"[LCD] Error in update loop ({consecutive_errors}/{MAX_CONSECUTIVE_ERRORS}): {e}")
                 
                 # If too many consecutive errors, try a reset first
                 if consecutive_errors == 2:
                     print("[LCD] Multiple errors detected, attempting emergency reset...")
-                    await self._reset_lcd_hardware()
+                    await self._reset_lcd_hardware(rebuild_bus=True)
                 
                 # If too many consecutive errors after reset attempt, disable LCD
-                if consecutive_errors >= max_consecutive_errors:
-                    print(f"[LCD] CRITICAL: Disabling LCD after {max_consecutive_errors} errors")
+                if consecutive_errors >= MAX_CONSECUTIVE_ERRORS:
+                    print(f"[LCD] CRITICAL: Disabling LCD after {MAX_CONSECUTIVE_ERRORS} errors")
                     print(f"[LCD] Last error: {e}")
                     print(f"[LCD] Web server and WiFi should remain functional")
                     self.enabled = False
                     self.lcd = None
                     return
                 
-                await asyncio.sleep(1)  # Back off on errors
+                await sleep_ms(ERROR_BACKOFF_MS)  # Back off on errors
 
 
 # Singleton instance
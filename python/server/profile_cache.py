@@ -31,7 +31,7 @@ class ProfileCache:
         if self._initialized:
             return
 
-        self._profile_names = []  # List of profile names (without .json extension)
+        self._profile_names = ()  # Sorted tuple of profile names (without .json extension)
         self._profiles_dir = None
         self._initialized = True
         print("[ProfileCache] Singleton instance created")
@@ -59,13 +59,9 @@ class ProfileCache:
             return 0
 
         # Extract profile names (just filenames, no file reading)
-        self._profile_names = []
-        for filename in files:
-            if filename.endswith('.json'):
-                profile_name = filename[:-5]  # Remove .json extension
-                self._profile_names.append(profile_name)
-
-        self._profile_names.sort()
+        names = [f[:-5] for f in files if f.endswith('.json')]  # Remove .json extension
+        names.sort()
+        self._profile_names = tuple(names)
 
         # Force GC after scanning
         gc.collect()
@@ -91,9 +87,10 @@ class ProfileCache:
         Get list of all cached profile names
 
         Returns:
-            Sorted list of profile names (without .json extension)
+            Sorted tuple of profile names (without .json extension). The
+            tuple is immutable, so it is returned as-is without a copy.
         """
-        return list(self._profile_names)  # Return copy to prevent modification
+        return self._profile_names
 
     def add(self, profile_name):
         """
@@ -105,8 +102,10 @@ class ProfileCache:
             profile_name: Profile name (without .json extension)
         """
         if profile_name not in self._profile_names:
-            self._profile_names.append(profile_name)
-            self._profile_names.sort()
+            names = list(self._profile_names)
+            names.append(profile_name)
+            names.sort()
+            self._profile_names = tuple(names)
             print(f"[ProfileCache] Added '{profile_name}' to cache")
 
     def remove(self, profile_name):
@@ -120,7 +119,7 @@ class ProfileCache:
             True if profile was removed, False if not found
         """
         if profile_name in self._profile_names:
-            self._profile_names.remove(profile_name)
+            self._profile_names = tuple(n for n in self._profile_names if n != profile_name)
             print(f"[ProfileCache] Removed '{profile_name}' from cache")
             return True
         return False
@@ -142,7 +141,7 @@ class ProfileCache:
     def clear(self):
         """Clear all cached profile names (frees memory)"""
         count = len(self._profile_names)
-        self._profile_names.clear()
+        self._profile_names = ()
         gc.collect()
         print(f"[ProfileCache] Cleared {count} cached profile names")
 
@@ -160,6 +160,23 @@ class StatusReceiver:
         """
         return self.status_cache.get_fields(*fields)
 
+    def get_status_values(self, fields, defaults, out=None):
+        """
+        Get multiple fields from cached status as a list, in order
+
+        Args:
+            fields: Tuple of field names to retrieve
+            defaults: Tuple of defaults, one per field (used if missing)
+            out: Optional list of len(fields) to fill in place
+
+        Returns:
+            List of field values (out, if given)
+
+        Example:
+            receiver.get_status_values(('state', 'current_temp'), ('IDLE', 0.0))
+        """
+        return self.status_cache.get_values(fields, defaults, out)
+
     async def run(self):
         """
         Main async task that consumes status updates
@@ -24,7 +24,7 @@ from kiln.comms import CommandMessage, QueueHelper
 from kiln.tuner import MODE_SAFE, MODE_STANDARD, MODE_THOROUGH, MODE_HIGH_TEMP
 from server.status_receiver import get_status_receiver
 from server.profile_cache import get_profile_cache
-from server.html_cache import get_html_cache
+from server import html_cache
 
 # MEMORY OPTIMIZED: pre-encoded HTTP status lines (bytes, allocated once).
 HTTP_200 = b"HTTP/1.1 200 OK\r\n"
@@ -153,6 +153,22 @@ async def send_html_response(writer, html, status=200):
     await send_response(writer, status, html.encode() if isinstance(html, str) else html, 'text/html')
 
 
+async def send_html_chunks(writer, chunks, status=200):
+    """Send an HTML response from pre-sliced memoryview chunks.
+
+    Each chunk is drained before the next is written, so the stream never
+    has to copy a partially sent buffer into its own output buffer.
+    """
+    writer.write(_STATUS_LINES.get(status, HTTP_500))
+    writer.write(HEADER_CONTENT_TYPE_HTML)
+    writer.write(HEADER_CORS)
+    writer.write(HEADER_CONNECTION_CLOSE)
+    await writer.drain()
+    for chunk in chunks:
+        writer.write(chunk)
+        await writer.drain()
+
+
 async def _send_command(writer, command, ok_message, ok_log=None):
     """Queue a bodyless control command with a uniform success / queue-full reply."""
     if QueueHelper.put_nowait(command_queue, command):
@@ -488,10 +504,19 @@ async def handle_api_files_delete(writer, directory, filename):
     try:
         os.remove(filepath)
         print(f"[Web Server] Deleted file: {filepath}")
+        if directory == 'profiles':
+            _refresh_profiles_index()
         await send_json_response(writer, {'success': True, 'message': f'Deleted {filename}'})
     except OSError as e:
         await send_json_response(writer, {'success': False, 'error': f'Failed to delete file: {e}'}, 500)
 
+def _refresh_profiles_index():
+    """Rescan the profile cache and re-render the index's profile list"""
+    profile_cache = get_profile_cache()
+    profile_cache.refresh()
+    profiles_html = html_cache.render_profiles_list(profile_cache.list_profiles())
+    html_cache.prerender('index', {'{profiles_list}': profiles_html})
+
 async def handle_api_files_upload(writer, directory, filename, reader, content_length):
     """PUT /api/files/<directory>/<filename> - stream the raw request body to disk in 1KB chunks."""
     dir_path = await _file_guard(writer, directory, filename)
@@ -550,7 +575,8 @@ async def handle_api_files_upload(writer, directory, filename, reader, content_l
         return
 
     if directory == 'profiles':
-        get_profile_cache().refresh()
+        # Re-render the index so its profile list includes the upload
+        _refresh_profiles_index()
 
     print(f"[Web Server] Uploaded file: {filepath} ({written} bytes)")
     await send_json_response(writer, {
@@ -680,10 +706,10 @@ async def handle_tuning_page(writer):
     gc.collect()
 
     # PERFORMANCE: Use cached HTML instead of blocking file I/O
-    html = get_html_cache().get('tuning')
+    chunks = html_cache.get_chunks('tuning')
 
-    if html:
-        await send_html_response(writer, html)
+    if chunks:
+        await send_html_chunks(writer, chunks)
     else:
         # Fallback: cache miss
         await send_response(writer, 404, b'Tuning page not found', 'text/plain')
@@ -693,11 +719,11 @@ async def handle_tuning_page(writer):
 async def handle_index(writer):
     """Serve pre-rendered index.html (profiles list already included)"""
     # PERFORMANCE: Use pre-rendered HTML from cache (no JSON building, no replacements)
-    html = get_html_cache().get('index')
+    chunks = html_cache.get_chunks('index')
 
-    if html:
+    if chunks:
         # Send pre-rendered HTML - client will fetch data via /api/status
-        await send_html_response(writer, html)
+        await send_html_chunks(writer, chunks)
     else:
         # Fallback: cache miss (shouldn't happen if preload succeeded)
         await send_response(writer, 500, b'HTML cache miss', 'text/plain')
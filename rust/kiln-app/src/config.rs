@@ -229,8 +229,12 @@ pub struct KilnConfig {
     pub log_level: LogLevel,
     pub log_to_flash: bool,
 
-    // --- LCD (disabled unless any `LCD_I2C_*` key is present) ---
+    // --- LCD (disabled unless any `LCD_I2C_*` key is present, or switched by
+    // `LCD_ENABLED`) ---
     pub lcd_enabled: bool,
+    /// Explicit `LCD_ENABLED` value, if the config sets one. Overrides the
+    /// key-presence rule either way, as `lcd_manager.py` does.
+    pub lcd_enabled_key: Option<bool>,
     pub lcd_i2c_id: u8,
     pub lcd_i2c_scl: u8,
     pub lcd_i2c_sda: u8,
@@ -302,6 +306,7 @@ impl Default for KilnConfig {
             log_to_flash: true,
 
             lcd_enabled: false,
+            lcd_enabled_key: None,
             lcd_i2c_id: 0,
             lcd_i2c_scl: 21,
             lcd_i2c_sda: 20,
@@ -428,7 +433,10 @@ impl KilnConfig {
         j.string("LOG_LEVEL", self.log_level.as_str())?;
         j.boolean("LOG_TO_FLASH", self.log_to_flash)?;
 
-        if self.lcd_enabled {
+        if let Some(on) = self.lcd_enabled_key {
+            j.boolean("LCD_ENABLED", on)?;
+        }
+        if self.lcd_enabled || self.lcd_enabled_key.is_some() {
             j.int("LCD_I2C_ID", self.lcd_i2c_id as u64)?;
             j.int("LCD_I2C_SCL", self.lcd_i2c_scl as u64)?;
             j.int("LCD_I2C_SDA", self.lcd_i2c_sda as u64)?;
@@ -472,6 +480,11 @@ pub fn parse_over(base: KilnConfig, json: &str) -> Result<KilnConfig, ConfigErro
         r.expect(b'}')?;
         break;
     }
+    // `LCD_ENABLED` wins over the `LCD_I2C_*` presence rule wherever it appears
+    // in the document (and across patches, since it is kept on the config).
+    if let Some(on) = cfg.lcd_enabled_key {
+        cfg.lcd_enabled = on;
+    }
     Ok(cfg)
 }
 
@@ -540,6 +553,7 @@ fn apply_key(cfg: &mut KilnConfig, key: &str, r: &mut Reader) -> Result<(), Conf
         }
         "LOG_TO_FLASH" => cfg.log_to_flash = r.parse_bool()?,
 
+        "LCD_ENABLED" => cfg.lcd_enabled_key = Some(r.parse_bool()?),
         "LCD_I2C_ID" => {
             cfg.lcd_enabled = true;
             cfg.lcd_i2c_id = r.parse_number()? as u8;
@@ -1083,6 +1097,35 @@ mod tests {
         assert_eq!(on.lcd_i2c_sda, 20);
     }
 
+    #[test]
+    fn lcd_enabled_key_overrides_key_presence() {
+        // Switched off with the pins still configured, in either key order.
+        let off = parse(r#"{"LCD_I2C_SDA": 20, "LCD_ENABLED": false}"#).unwrap();
+        assert!(!off.lcd_enabled);
+        let off = parse(r#"{"LCD_ENABLED": false, "LCD_I2C_SDA": 20}"#).unwrap();
+        assert!(!off.lcd_enabled);
+        // A later patch touching an LCD_I2C_* key keeps the explicit switch.
+        let patched = parse_over(off, r#"{"LCD_I2C_ADDR": 63}"#).unwrap();
+        assert!(!patched.lcd_enabled);
+        assert_eq!(patched.lcd_i2c_addr, 63);
+        // Switched on with no pins given: the defaults are used.
+        let on = parse(r#"{"LCD_ENABLED": true}"#).unwrap();
+        assert!(on.lcd_enabled);
+        assert_eq!(on.lcd_i2c_scl, 21);
+    }
+
+    #[test]
+    fn write_json_round_trips_lcd_enabled() {
+        let c = parse(r#"{"LCD_ENABLED": false, "LCD_I2C_ADDR": 63}"#).unwrap();
+        let mut s = String::new();
+        c.write_json(&mut s).unwrap();
+        assert!(s.contains(r#""LCD_ENABLED":false"#));
+        let back = parse(&s).unwrap();
+        assert_eq!(back, c);
+        assert!(!back.lcd_enabled);
+        assert_eq!(back.lcd_i2c_addr, 63);
+    }
+
     #[test]
     fn unknown_keys_are_ignored() {
         let c = parse(
@@ -6,7 +6,7 @@ This module handles loading tuning data from CSV files and detecting test phases
 
 import csv
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, TextIO, Union
 
 
 # =============================================================================
@@ -36,18 +36,29 @@ class Phase:
 # Data Loading
 # =============================================================================
 
-def load_tuning_data(csv_file: str) -> Dict:
+def load_tuning_data(csv_file: Union[str, TextIO]) -> Dict:
     """
     Load comprehensive tuning data from CSV file.
 
     Args:
-        csv_file: Path to CSV file with tuning data
+        csv_file: Path to CSV file with tuning data, or an
+                  already-open text file object (e.g. opened with a large
+                  read buffer by the caller)
 
     Returns:
         Dictionary with all data arrays: time, temp, ssr_output, timestamps,
         and optionally step_names, step_indices, total_steps if available.
         Also includes 'has_step_data' flag indicating if step columns exist.
     """
+    if hasattr(csv_file, 'read'):
+        return _parse_tuning_csv(csv_file)
+
+    with open(csv_file, 'r') as f:
+        return _parse_tuning_csv(f)
+
+
+def _parse_tuning_csv(f: TextIO) -> Dict:
+    """Parse an open tuning CSV stream (see load_tuning_data)."""
     time_data = []
     temp_data = []
     ssr_output_data = []
@@ -57,32 +68,31 @@ def load_tuning_data(csv_file: str) -> Dict:
     total_steps_data = []
     has_step_data = False
 
-    with open(csv_file, 'r') as f:
-        reader = csv.DictReader(f)
+    reader = csv.DictReader(f)
 
-        # Check if step columns exist in the CSV
-        fieldnames = reader.fieldnames or []
-        has_step_columns = all(col in fieldnames for col in ['step_name', 'step_index', 'total_steps'])
+    # Check if step columns exist in the CSV
+    fieldnames = reader.fieldnames or []
+    has_step_columns = all(col in fieldnames for col in ['step_name', 'step_index', 'total_steps'])
 
-        if has_step_columns:
-            has_step_data = True
+    if has_step_columns:
+        has_step_data = True
 
-        for row in reader:
-            # Skip RECOVERY state entries
-            if row.get('state') == 'RECOVERY':
-                continue
+    for row in reader:
+        # Skip RECOVERY state entries
+        if row.get('state') == 'RECOVERY':
+            continue
 
-            # Note: elapsed_seconds in tuning CSV is per-step, not overall
-            # We'll calculate overall elapsed time from timestamps below
-            temp_data.append(float(row['current_temp_c']))
-            ssr_output_data.append(float(row['ssr_output_percent']))
-            timestamps.append(row['timestamp'])
-
-            # Load step data if available
-            if has_step_columns:
-                step_names.append(row['step_name'])
-                step_indices.append(int(row['step_index']))
-                total_steps_data.append(int(row['total_steps']))
+        # Note: elapsed_seconds in tuning CSV is per-step, not overall
+        # We'll calculate overall elapsed time from timestamps below
+        temp_data.append(float(row['current_temp_c']))
+        ssr_output_data.append(float(row['ssr_output_percent']))
+        timestamps.append(row['timestamp'])
+
+        # Load step data if available
+        if has_step_columns:
+            step_names.append(row['step_name'])
+            step_indices.append(int(row['step_index']))
+            total_steps_data.append(int(row['total_steps']))
 
     # Always calculate overall elapsed time from timestamps
     # (elapsed_seconds in tuning CSV is per-step, not overall)
@@ -32,14 +32,93 @@ import argparse
 from analyzer import load_tuning_data, detect_phases, Phase
 
 try:
-    import matplotlib.pyplot as plt
-    from matplotlib.gridspec import GridSpec
-    import matplotlib.patches as mpatches
+    import numpy as np
 except ImportError:
-    print("\n❌ Error: matplotlib is required for plotting")
-    print("Install it with: pip install matplotlib")
+    print("\n❌ Error: numpy is required")
+    print("Install it with: pip install numpy")
     sys.exit(1)
 
+# matplotlib is imported on first use by _import_matplotlib(): it is the
+# slowest import by far, and --help or a bad CSV should not pay for it.
+plt = None
+GridSpec = None
+mpatches = None
+
+# Read buffer for tuning CSVs: multi-MB logs are read in a few syscalls
+CSV_READ_BUFFER = 1 << 20
+
+# Saved-figure DPI; rasterized artists are baked at this resolution
+SAVE_DPI = 150
+
+# Series longer than this are rasterized instead of drawn as vector paths
+RASTERIZE_MIN_POINTS = 5000
+
+
+def _import_matplotlib():
+    """Import matplotlib into module globals (exits if it is missing)"""
+    global plt, GridSpec, mpatches
+    if plt is not None:
+        return
+
+    try:
+        import matplotlib.pyplot as plt
+        from matplotlib.gridspec import GridSpec
+        import matplotlib.patches as mpatches
+    except ImportError:
+        print("\n❌ Error: matplotlib is required for plotting")
+        print("Install it with: pip install matplotlib")
+        sys.exit(1)
+
+
+def _open_tuning_csv(path):
+    """
+    Open a tuning CSV for load_tuning_data() with a large read buffer
+
+    Args:
+        path: Path to a .csv tuning log
+
+    Returns:
+        Open text file object
+    """
+    return open(path, 'r', buffering=CSV_READ_BUFFER)
+
+
+def temp_range(data):
+    """
+    Get the (min, max) temperature of a tuning run
+
+    Computed once with NumPy reductions and stored on ``data`` so the
+    summary printout and the plot title share a single scan.
+
+    Args:
+        data: Dictionary with tuning data
+
+    Returns:
+        Tuple of (min_temp, max_temp) in °C
+    """
+    if 'temp_range' not in data:
+        temps = np.asarray(data['temp'], dtype=float)
+        data['temp_range'] = (float(temps.min()), float(temps.max()))
+    return data['temp_range']
+
+
+def find_step_changes(step_indices):
+    """
+    Find the samples where a new tuning step starts
+
+    Single vectorized np.diff pass instead of a per-sample Python loop.
+
+    Args:
+        step_indices: Per-sample step index (negative = no step)
+
+    Returns:
+        Array of sample indices (including 0) where the step index changes
+        to a valid (non-negative) step
+    """
+    sidx = np.asarray(step_indices, dtype=np.int32)
+    changes = np.flatnonzero(np.diff(sidx, prepend=-1) != 0)
+    return changes[sidx[changes] >= 0]
+
 
 def calculate_heating_rate(data, phase):
     """
@@ -71,8 +150,19 @@ def plot_tuning_phases(data, phases, output_file=None):
         phases: List of Phase objects from analyzer.detect_phases()
         output_file: Optional output file path (None = show interactive plot)
     """
-    # Convert time to minutes for better readability
-    time_minutes = [t / 60 for t in data['time']]
+    _import_matplotlib()
+
+    # Convert every series to an ndarray once: matplotlib would otherwise
+    # re-convert the same Python lists on each plot/fill_between call
+    time_minutes = np.asarray(data['time'], dtype=float) / 60
+    temps = np.asarray(data['temp'], dtype=float)
+    ssr_output = np.asarray(data['ssr_output'], dtype=float)
+
+    # Step changes (empty if the CSV has no step columns)
+    if data.get('has_step_data', False):
+        transitions = find_step_changes(data['step_indices'])
+    else:
+        transitions = np.empty(0, dtype=np.intp)
 
     # Phase color mapping (consistent with physics-based detection)
     phase_colors = {
@@ -95,17 +185,16 @@ def plot_tuning_phases(data, phases, output_file=None):
 
         ax1.axvspan(start_time, end_time, alpha=0.3, color=color)
 
-    # Draw step transition lines if step data available
-    if data.get('has_step_data', False):
-        step_indices = data['step_indices']
-        prev_step = -1
-        for i, step_idx in enumerate(step_indices):
-            if step_idx != prev_step and step_idx >= 0 and i > 0:
-                ax1.axvline(x=time_minutes[i], color='gray', linestyle='--', alpha=0.5, linewidth=1.5)
-                prev_step = step_idx
+    # Draw step transition lines (skip the run start)
+    for i in transitions[transitions > 0]:
+        ax1.axvline(x=time_minutes[i], color='gray', linestyle='--', alpha=0.5, linewidth=1.5)
+
+    # Very long runs are rasterized: one bitmap beats a huge vector path
+    rasterize_lines = len(time_minutes) > RASTERIZE_MIN_POINTS
 
     # Plot temperature
-    ax1.plot(time_minutes, data['temp'], 'b-', linewidth=2, label='Temperature')
+    ax1.plot(time_minutes, temps, 'b-', linewidth=2, label='Temperature',
+             rasterized=rasterize_lines)
 
     # Annotate each phase with enhanced info
     for phase in phases:
@@ -140,19 +229,16 @@ def plot_tuning_phases(data, phases, output_file=None):
         color = phase_colors.get(phase.phase_type, 'lightgray')
         ax2.axvspan(start_time, end_time, alpha=0.3, color=color)
 
-    # Draw step transition lines if step data available
-    if data.get('has_step_data', False):
-        step_indices = data['step_indices']
-        prev_step = -1
-        for i, step_idx in enumerate(step_indices):
-            if step_idx != prev_step and step_idx >= 0 and i > 0:
-                ax2.axvline(x=time_minutes[i], color='gray', linestyle='--', alpha=0.5, linewidth=1.5)
-                prev_step = step_idx
-
-    ax2.fill_between(time_minutes, 0, data['ssr_output'],
-                     alpha=0.5, color='orange')
-    ax2.plot(time_minutes, data['ssr_output'],
-            'orange', linewidth=1.5, label='SSR Output (%)')
+    # Draw step transition lines (skip the run start)
+    for i in transitions[transitions > 0]:
+        ax2.axvline(x=time_minutes[i], color='gray', linestyle='--', alpha=0.5, linewidth=1.5)
+
+    # The SSR fill is the heaviest polygon in the figure - always rasterize it
+    ax2.fill_between(time_minutes, 0, ssr_output,
+                     alpha=0.5, color='orange', rasterized=True)
+    ax2.plot(time_minutes, ssr_output,
+            'orange', linewidth=1.5, label='SSR Output (%)',
+            rasterized=rasterize_lines)
     ax2.set_ylabel('SSR Output (%)', fontsize=12)
     ax2.set_ylim(-5, 105)
     ax2.grid(True, alpha=0.3)
@@ -172,20 +258,17 @@ def plot_tuning_phases(data, phases, output_file=None):
     if data.get('has_step_data', False) and data.get('step_names'):
         step_indices = data['step_indices']
         step_names = data['step_names']
-        prev_step = -1
         step_transitions = []
 
-        # Collect step transitions
-        for i, step_idx in enumerate(step_indices):
-            if step_idx != prev_step and step_idx >= 0:
-                if i < len(step_names) and step_names[i]:
-                    step_transitions.append({
-                        'idx': i,
-                        'time': time_minutes[i],
-                        'name': step_names[i],
-                        'step_idx': step_idx
-                    })
-                prev_step = step_idx
+        # Collect named step transitions
+        for i in transitions:
+            if i < len(step_names) and step_names[i]:
+                step_transitions.append({
+                    'idx': i,
+                    'time': time_minutes[i],
+                    'name': step_names[i],
+                    'step_idx': step_indices[i]
+                })
 
         # Draw step regions with alternating colors
         for idx, trans in enumerate(step_transitions):
@@ -239,8 +322,7 @@ def plot_tuning_phases(data, phases, output_file=None):
 
     # Add summary info
     duration = time_minutes[-1]
-    max_temp = max(data['temp'])
-    min_temp = min(data['temp'])
+    min_temp, max_temp = temp_range(data)
     start_time = data['timestamps'][0]
 
     fig.suptitle(
@@ -252,7 +334,7 @@ def plot_tuning_phases(data, phases, output_file=None):
     plt.tight_layout()
 
     if output_file:
-        plt.savefig(output_file, dpi=150, bbox_inches='tight')
+        plt.savefig(output_file, dpi=SAVE_DPI, bbox_inches='tight')
         print(f"✓ Enhanced tuning phase graph saved to: {output_file}")
     else:
         plt.show()
@@ -324,12 +406,12 @@ Phase Detection:
 
     try:
         # Load data using analyzer module
-        data = load_tuning_data(args.csv_file)
+        with _open_tuning_csv(args.csv_file) as f:
+            data = load_tuning_data(f)
         print(f"✓ Loaded {len(data['time']):,} data points")
 
         duration_min = data['time'][-1] / 60
-        max_temp = max(data['temp'])
-        min_temp = min(data['temp'])
+        min_temp, max_temp = temp_range(data)
 
         print(f"✓ Duration: {duration_min:.1f} minutes ({duration_min/60:.2f} hours)")
         print(f"✓ Temperature range: {min_temp:.1f}°C - {max_temp:.1f}°C")
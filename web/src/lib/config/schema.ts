@@ -365,7 +365,7 @@ export const SECTIONS: ConfigSectionDef[] = [
 		id: "lcd",
 		title: "Display (LCD)",
 		description:
-			"Optional I²C LCD1602. If your kiln has no LCD, leave these untouched — editing any value enables the display.",
+			"Optional I²C LCD1602. If your kiln has no LCD, leave these untouched — editing any value enables the display, unless LCD_ENABLED is set to false in the stored config.",
 		fields: [
 			{
 				key: "LCD_I2C_ID",
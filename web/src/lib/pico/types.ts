@@ -263,6 +263,8 @@ export interface KilnConfig {
 	LOG_TO_FLASH: boolean;
 
 	// LCD (optional)
+	/** Explicit display switch; only present when the config sets it. */
+	LCD_ENABLED?: boolean;
 	LCD_I2C_ID: number;
 	LCD_I2C_SCL: number;
 	LCD_I2C_SDA: number;